@@ -7,16 +7,166 @@ searches for them on Album.link, and generates a consolidated list.
 """
 
 import feedparser
-import requests
+import httpx
+import orjson
+import asyncio
+import diskcache
 from bs4 import BeautifulSoup
+from rapidfuzz import fuzz, utils
 from urllib.parse import quote
 import argparse
 import csv
+import html
+import os
 import sys
 import re
 import time
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# iframe src for an Album.link URL (quoted with safe='' as a query value)
+ALBUM_LINK_EMBED = "https://song.link/embed?url={}"
+
+# Request timeout (seconds) applied to every iTunes / song.link call
+REQUEST_TIMEOUT = 10
+
+
+# Lookup cache lifetimes: found albums rarely change, misses are retried daily
+CACHE_TTL = 30 * 86400
+NEGATIVE_CACHE_TTL = 86400
+DEFAULT_CACHE_DIR = '.jazzcache'
+# Misses are kept in their own store inside the cache directory
+NEGATIVE_CACHE_SUBDIR = 'neg'
+
+# Country segment in Album.link URLs (e.g. /us/i/ -> /i/)
+_CC_RE = re.compile(r'/[a-z]{2}/i/')
+
+# Sentinel for cache misses, since None is a valid (negative) cached value
+_MISSING = object()
+
+
+# Normalized (artist, album), see album_key()
+AlbumKey = Tuple[str, str]
+
+
+def album_key(artist: str, album: str) -> AlbumKey:
+    """Normalized (artist, album) key shared by the lookup cache and deduplication."""
+    return (artist.casefold().strip(), album.casefold().strip())
+
+
+# Trailing edition markers on iTunes titles, e.g. "(Deluxe Edition) [Remastered]"
+# or " - EP"; repeated so stacked markers are all stripped
+_EDITION_RE = re.compile(r'(?:\s*[(\[][^)\]]*[)\]]|\s+-\s+(?:EP|Single))+\s*$')
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def title_similarity(title: str, candidate: str) -> float:
+    """
+    Score how well an iTunes album title matches a wanted title (0-100).
+
+    Uses token_sort_ratio rather than a subset-tolerant scorer, so "Live"
+    does not match "Live at the Village Vanguard". Trailing edition markers
+    and " - EP"/" - Single" on the candidate are ignored, and titles whose numbers differ
+    ("Vol. 1" vs "Vol. 2") never match.
+    """
+    candidate = _EDITION_RE.sub('', candidate) or candidate
+    if _NUMBER_RE.findall(title) != _NUMBER_RE.findall(candidate):
+        return 0.0
+    return fuzz.token_sort_ratio(title, candidate, processor=utils.default_process)
+
+
+def artist_similarity(artist: str, candidate: str) -> float:
+    """
+    Score how well an iTunes artistName matches a wanted artist (0-100).
+
+    Uses token_set_ratio so band and co-leader credits still match:
+    "Miles Davis" vs "Miles Davis Quintet" or "Joe Lovano & Dave Douglas".
+    """
+    return fuzz.token_set_ratio(artist, candidate, processor=utils.default_process)
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Create the HTTP client shared by all fetchers.
+
+    HTTP/2 lets concurrent lookups to the same host multiplex over a
+    single keep-alive connection instead of opening one per request.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers={'User-Agent': USER_AGENT},
+        timeout=REQUEST_TIMEOUT,
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class AlbumRow:
+    """One processed feed entry; links are empty strings when not found."""
+    artist: str
+    album: str
+    album_link: str
+    apple_link: str
+    date: str
+
+    @property
+    def embed_url(self) -> str:
+        """song.link embed URL for album_link ('' if there is none)."""
+        if not self.album_link:
+            return ''
+        return ALBUM_LINK_EMBED.format(quote(self.album_link, safe=''))
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter shared by all fetchers.
+
+    Allows bursts of up to `max_tokens` calls, then refills at `refill_rate`
+    tokens per second. When the API answers 429 the bucket pauses for
+    `backoff_pause` seconds and the refill rate backs off multiplicatively
+    (down to `min_refill_rate`); it recovers additively on success.
+    """
+
+    def __init__(self, max_tokens: int = 10, refill_rate: float = 1 / 6.0,
+                 min_refill_rate: float = 1 / 60.0, backoff_pause: float = 60.0):
+        self.max_tokens = max_tokens
+        self.tokens = float(max_tokens)
+        self.refill_rate = refill_rate
+        self.max_refill_rate = refill_rate
+        self.min_refill_rate = min_refill_rate
+        self.backoff_pause = backoff_pause
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self.last) * self.refill_rate)
+        self.last = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= 1
+
+    def backoff(self):
+        """Pause and halve the refill rate after the API reported rate limiting."""
+        self._refill()
+        self.refill_rate = max(self.min_refill_rate, self.refill_rate * 0.5)
+        # Drop any burst and go into debt so the next token only arrives
+        # once the API's rate-limit window has passed
+        self.tokens = min(self.tokens, -self.backoff_pause * self.refill_rate)
+
+    def recover(self):
+        """Nudge the refill rate back towards its configured maximum."""
+        self.refill_rate = min(self.max_refill_rate, self.refill_rate + self.max_refill_rate / 10)
 
 
 class AlbumFetcher:
@@ -24,35 +174,107 @@ class AlbumFetcher:
 
     RSS_URL = "https://www.allaboutjazz.com/rss_reviews.xml"
     ALBUM_LINK_SEARCH = "https://album.link/search?q={}"
-
-    # Patterns to remove from titles
-    REMOVE_PATTERNS = [
-        r'\s*album review\s*$',
-        r'\s*concert review\s*$',
-        r'\s*premiere\s*$',
-        r'\s*review\s*$',
-    ]
-
-    def __init__(self, verbose: bool = False):
+    ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+
+    # Minimum title_similarity() for matching an album title against
+    # an artist's catalogue in bulk searches
+    ALBUM_MATCH_CUTOFF = 90
+    # Minimum artist_similarity() between the requested artist and an
+    # iTunes result's artistName for it to be accepted
+    ARTIST_MATCH_CUTOFF = 80
+
+    # Maximum concurrent iTunes Search API requests
+    ITUNES_CONCURRENCY = 10
+
+    # Suffixes to remove from titles, fused into one pattern (repeated so
+    # stacked suffixes like "review premiere" are all stripped)
+    _SUFFIX_RE = re.compile(r'(?:\s*(?:album review|concert review|premiere|review))+\s*$', re.IGNORECASE)
+
+    def __init__(self, client: httpx.AsyncClient, verbose: bool = False,
+                 rate_limiter: Optional[AsyncTokenBucket] = None,
+                 cache: Optional[diskcache.Cache] = None,
+                 negative_cache: Optional[diskcache.Cache] = None,
+                 lookups: Optional[Dict[AlbumKey, asyncio.Future]] = None,
+                 itunes_limit: Optional[asyncio.Semaphore] = None):
         self.verbose = verbose
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.client = client
+        # song.link allows 10 requests/minute without API key; share one
+        # bucket between fetchers so the limit is respected globally
+        self.rate_limiter = rate_limiter or AsyncTokenBucket()
+        # Persistent lookup cache (None disables caching), fronted by a
+        # per-run memo so repeated lookups never hit the network twice
+        self.cache = cache
+        # Known misses; without one, misses are stored as None in the main cache
+        self.negative_cache = negative_cache
+        self._memo = {}
+        # In-flight album lookups by normalized (artist, album); share one
+        # dict between fetchers so an album is only looked up once per run
+        self.lookups = lookups if lookups is not None else {}
+        # Bounds the iTunes prefetch stage; share one between fetchers so
+        # concurrent feeds don't multiply the load on the iTunes API
+        self.itunes_limit = itunes_limit or asyncio.Semaphore(self.ITUNES_CONCURRENCY)
 
     def log(self, message: str):
         """Print message if verbose mode is enabled."""
         if self.verbose:
             print(f"[INFO] {message}")
 
-    def fetch_rss(self) -> List[dict]:
+    def _cache_get(self, key: tuple):
+        """Return the cached value for key (None for a known miss), or _MISSING."""
+        if key in self._memo:
+            return self._memo[key]
+        value = _MISSING
+        if self.negative_cache is not None and key in self.negative_cache:
+            value = None
+        elif self.cache is not None:
+            value = self.cache.get(key, default=_MISSING)
+        if value is not _MISSING:
+            self._memo[key] = value
+        return value
+
+    def _cache_set(self, key: tuple, value: Optional[str]):
+        """Cache a lookup result; misses go to the negative cache and expire sooner."""
+        self._memo[key] = value
+        if value:
+            if self.cache is not None:
+                self.cache.set(key, value, expire=CACHE_TTL)
+        elif self.negative_cache is not None:
+            self.negative_cache.set(key, True, expire=NEGATIVE_CACHE_TTL)
+        elif self.cache is not None:
+            self.cache.set(key, None, expire=NEGATIVE_CACHE_TTL)
+
+    async def fetch_rss(self) -> List[dict]:
         """Fetch and parse the All About Jazz RSS feed."""
         self.log(f"Fetching RSS from {self.RSS_URL}")
+
+        # Conditional GET: send the validators from the last run so an
+        # unchanged feed answers 304 and we reuse the stored entries
+        key = ('rss', self.RSS_URL)
+        cached_feed = self._cache_get(key)
+        if cached_feed is _MISSING:
+            cached_feed = None
+
         try:
-            feed = feedparser.parse(self.RSS_URL)
+            # feedparser is blocking, keep it off the event loop
+            feed = await asyncio.to_thread(
+                feedparser.parse, self.RSS_URL,
+                etag=cached_feed['etag'] if cached_feed else None,
+                modified=cached_feed['modified'] if cached_feed else None,
+                agent=USER_AGENT,
+            )
+            if feed.get('status') == 304 and cached_feed:
+                self.log(f"RSS feed not modified, reusing {len(cached_feed['entries'])} cached entries")
+                return cached_feed['entries']
             if feed.bozo:
                 self.log(f"Warning: RSS feed parsing had errors: {feed.get('bozo_exception', 'Unknown error')}")
             self.log(f"Found {len(feed.entries)} entries")
+
+            if self.cache is not None and (feed.get('etag') or feed.get('modified')):
+                self.cache.set(key, {
+                    'etag': feed.get('etag'),
+                    'modified': feed.get('modified'),
+                    'entries': feed.entries,
+                })
             return feed.entries
         except Exception as e:
             self.log(f"Error fetching RSS feed: {e}")
@@ -71,11 +293,7 @@ class AlbumFetcher:
             Tuple of (artist, album) or None if parsing fails
         """
         # Remove common suffixes
-        cleaned = title
-        for pattern in self.REMOVE_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-
-        cleaned = cleaned.strip()
+        cleaned = self._SUFFIX_RE.sub('', title).strip()
 
         # Split on first colon
         if ':' not in cleaned:
@@ -94,7 +312,7 @@ class AlbumFetcher:
 
         return (artist, album)
 
-    def search_apple_music(self, artist: str, album: str) -> Optional[str]:
+    async def search_apple_music(self, artist: str, album: str) -> Optional[str]:
         """
         Search Apple Music for the album and return the Apple Music album URL.
 
@@ -109,11 +327,16 @@ class AlbumFetcher:
         """
         query = f"{artist} {album}"
 
+        key = ('itunes', *album_key(artist, album))
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            self.log(f"Cached Apple Music result for: {query}")
+            return cached
+
         self.log(f"Searching Apple Music for: {query}")
 
         try:
             # iTunes Search API
-            search_url = "https://itunes.apple.com/search"
             params = {
                 'term': query,
                 'media': 'music',
@@ -121,35 +344,149 @@ class AlbumFetcher:
                 'limit': 5
             }
 
-            response = self.session.get(search_url, params=params, timeout=10)
+            async with self.itunes_limit:
+                response = await self.client.get(self.ITUNES_SEARCH_URL, params=params)
             response.raise_for_status()
+            data = orjson.loads(response.content)
 
-            data = response.json()
             results = data.get('results', [])
 
-            if results:
-                # Get the first result's collection view URL
-                first_result = results[0]
-                apple_url = first_result.get('collectionViewUrl')
+            # Keep results by the requested artist, then pick the closest
+            # album title; artist and album must both match on their own
+            apple_url = self.match_album(album, self.filter_by_artist(artist, results))
 
-                if apple_url:
-                    self.log(f"Found Apple Music URL: {apple_url}")
-                    return apple_url
-                else:
-                    self.log("No URL in Apple Music result")
-                    return None
+            if apple_url:
+                self.log(f"Found Apple Music URL: {apple_url}")
+            elif results:
+                self.log(f"No close Apple Music match for: {query}")
             else:
                 self.log(f"No Apple Music results for: {query}")
-                return None
 
-        except requests.RequestException as e:
+            self._cache_set(key, apple_url)
+            return apple_url
+
+        except httpx.HTTPError as e:
             self.log(f"Error searching Apple Music: {e}")
             return None
         except ValueError as e:
             self.log(f"Error parsing Apple Music response: {e}")
             return None
 
-    def convert_url_to_album_link(self, music_url: str) -> Optional[str]:
+    async def search_artist_albums(self, artist: str) -> List[dict]:
+        """
+        Fetch up to 25 albums for an artist from the iTunes Search API.
+
+        Args:
+            artist: Artist name
+
+        Returns:
+            List of iTunes album results (empty on error)
+        """
+        self.log(f"Searching Apple Music catalogue for: {artist}")
+
+        try:
+            params = {
+                'term': artist,
+                'media': 'music',
+                'entity': 'album',
+                'attribute': 'artistTerm',
+                'limit': 25
+            }
+
+            async with self.itunes_limit:
+                response = await self.client.get(self.ITUNES_SEARCH_URL, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            return data.get('results', [])
+
+        except httpx.HTTPError as e:
+            self.log(f"Error searching Apple Music catalogue: {e}")
+            return []
+        except ValueError as e:
+            self.log(f"Error parsing Apple Music response: {e}")
+            return []
+
+    def filter_by_artist(self, artist: str, results: List[dict]) -> List[dict]:
+        """
+        Keep the iTunes results whose artistName matches the requested artist.
+
+        Args:
+            artist: Artist name
+            results: iTunes album results
+
+        Returns:
+            Results scoring at least ARTIST_MATCH_CUTOFF on artist_similarity()
+        """
+        return [
+            result for result in results
+            if artist_similarity(artist, result.get('artistName', '')) >= self.ARTIST_MATCH_CUTOFF
+        ]
+
+    def match_album(self, album: str, catalogue: List[dict]) -> Optional[str]:
+        """
+        Pick the Apple Music URL of the catalogue entry best matching an album title.
+
+        Args:
+            album: Album title
+            catalogue: iTunes album results for the artist
+
+        Returns:
+            Apple Music album URL or None if nothing is similar enough
+        """
+        best_score, best = 0.0, None
+        for result in catalogue:
+            score = title_similarity(album, result.get('collectionName', ''))
+            if score > best_score:
+                best_score, best = score, result
+
+        if best_score < self.ALBUM_MATCH_CUTOFF:
+            return None
+        return best.get('collectionViewUrl')
+
+    async def search_apple_music_bulk(self, albums: Dict[AlbumKey, Tuple[str, str]]) -> Dict[AlbumKey, Optional[str]]:
+        """
+        Search Apple Music for several albums, batching lookups per artist.
+
+        Artists with more than one uncached album are fetched with a single
+        catalogue query and matched client-side. Albums that are cached, by
+        a one-off artist, or unmatched fall back to search_apple_music.
+
+        Args:
+            albums: Normalized album_key() -> (artist, album)
+
+        Returns:
+            Apple Music album URL (or None) for each key
+        """
+        keys_by_artist = defaultdict(list)
+        for key in albums:
+            if self._cache_get(('itunes', *key)) is _MISSING:
+                keys_by_artist[key[0]].append(key)
+
+        repeated = [keys for keys in keys_by_artist.values() if len(keys) > 1]
+        catalogues = await asyncio.gather(*(
+            self.search_artist_albums(albums[keys[0]][0]) for keys in repeated
+        ))
+
+        matched = {}
+        for keys, catalogue in zip(repeated, catalogues):
+            # artistTerm also returns artists whose names merely contain the
+            # term; filter the same way as search_apple_music
+            catalogue = self.filter_by_artist(albums[keys[0]][0], catalogue)
+            for key in keys:
+                artist, album = albums[key]
+                apple_url = self.match_album(album, catalogue)
+                if apple_url:
+                    self.log(f"Matched {artist} - {album} in catalogue: {apple_url}")
+                    self._cache_set(('itunes', *key), apple_url)
+                    matched[key] = apple_url
+
+        async def lookup(key: AlbumKey) -> Optional[str]:
+            return matched.get(key) or await self.search_apple_music(*albums[key])
+
+        return dict(zip(albums, await asyncio.gather(*(lookup(key) for key in albums))))
+
+    async def convert_url_to_album_link(self, music_url: str) -> Optional[str]:
         """
         Convert any music streaming URL to Album.link URL using song.link API.
 
@@ -161,104 +498,105 @@ class AlbumFetcher:
         """
         api_url = f"https://api.song.link/v1-alpha.1/links?url={quote(music_url)}"
 
-        self.log(f"Converting to Album.link via API...")
+        key = ('songlink', music_url)
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            self.log(f"Cached Album.link for: {music_url}")
+            return cached
 
-        # Rate limiting: 10 requests/minute without API key
-        # Sleep 6 seconds between requests to stay safe
-        time.sleep(6)
+        self.log(f"Converting to Album.link via API...")
 
         try:
-            response = self.session.get(api_url, timeout=10)
+            # Rate limiting: 10 requests/minute without API key; on a 429
+            # slow the shared bucket down and retry once
+            for _ in range(2):
+                await self.rate_limiter.acquire()
+                response = await self.client.get(api_url)
+                if response.status_code != 429:
+                    break
+                self.log("song.link rate limit hit, backing off")
+                self.rate_limiter.backoff()
+            if response.status_code in (400, 404):
+                # song.link can't resolve this URL; remember the miss so
+                # later runs don't spend a rate-limit token on it again
+                self.log(f"song.link could not resolve URL (HTTP {response.status_code})")
+                self._cache_set(key, None)
+                return None
             response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.rate_limiter.recover()
 
-            data = response.json()
             page_url = data.get('pageUrl')
 
             if page_url:
                 # Remove country code from URL (e.g., /us/i/ -> /i/)
                 # The canonical URLs work better without country codes
-                page_url = page_url.replace('/us/i/', '/i/')
-                page_url = page_url.replace('/uk/i/', '/i/')
-                page_url = page_url.replace('/ca/i/', '/i/')
+                page_url = _CC_RE.sub('/i/', page_url)
 
                 self.log(f"Got Album.link: {page_url}")
-                return page_url
             else:
                 self.log("No pageUrl in API response")
-                return None
 
-        except requests.RequestException as e:
+            self._cache_set(key, page_url)
+            return page_url
+
+        except httpx.HTTPError as e:
             self.log(f"Error calling song.link API: {e}")
             return None
         except ValueError as e:
             self.log(f"Error parsing API response: {e}")
             return None
 
-    def search_album_link(self, artist: str, album: str) -> Optional[str]:
+    async def search_album_link(self, artist: str, album: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Search for album and return Album.link URL.
+        Search for album and return its Apple Music and Album.link URLs.
 
         Uses a two-step process:
         1. Search Apple Music for the album
         2. Convert Apple Music URL to Album.link using song.link API
 
+        Both steps go through the lookup cache, so calling this after a
+        bulk Apple Music prefetch does not repeat the iTunes request.
+
         Args:
             artist: Artist name
             album: Album title
 
         Returns:
-            Album.link URL or None if not found
+            Tuple of (apple_music_url, album_link); either may be None
         """
         # First, try to find on Apple Music
-        apple_url = self.search_apple_music(artist, album)
+        apple_url = await self.search_apple_music(artist, album)
+        album_link = None
 
         if apple_url:
             # Then try to convert to Album.link
-            album_link = self.convert_url_to_album_link(apple_url)
-            if album_link:
-                return album_link
+            album_link = await self.convert_url_to_album_link(apple_url)
 
-        self.log(f"No album.link found for: {artist} - {album}")
-        return None
+        if not album_link:
+            self.log(f"No album.link found for: {artist} - {album}")
+        return (apple_url, album_link)
 
-    def process_feed(self) -> List[Tuple[str, str, str, str, str]]:
+    async def process_feed(self) -> List[AlbumRow]:
         """
         Process RSS feed and search for albums.
 
+        Each unique album is looked up once, even when it appears several
+        times or in another feed. All Apple Music lookups run concurrently;
+        song.link conversions follow, throttled by the song.link rate limit.
+
         Returns:
-            List of tuples: (artist, album, album_link, apple_music_link, date)
+            List of AlbumRow, one per parsed entry
         """
-        entries = self.fetch_rss()
-        results = []
+        entries = await self.fetch_rss()
+        parsed_entries = []
 
         for entry in entries:
             title = entry.get('title', '')
-            pub_date = entry.get('published', '')
-
-            # Parse date
-            date_str = ''
-            if pub_date:
-                try:
-                    # Try RSS format first: "Fri, 08 Nov 2025 07:00:00 +0000"
-                    date_obj = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %z')
-                    date_str = date_obj.strftime('%Y-%m-%d')
-                except ValueError:
-                    try:
-                        # Try ISO 8601 format: "2025-11-08T07:00:00.000-08:00"
-                        # Handle both with and without microseconds
-                        if '.' in pub_date:
-                            date_obj = datetime.strptime(pub_date, '%Y-%m-%dT%H:%M:%S.%f%z')
-                        else:
-                            date_obj = datetime.strptime(pub_date, '%Y-%m-%dT%H:%M:%S%z')
-                        date_str = date_obj.strftime('%Y-%m-%d')
-                    except ValueError:
-                        # Fallback: try to extract date from RSS format by splitting
-                        try:
-                            date_parts = pub_date.split(',')[1].strip().split()[0:3]
-                            date_str = ' '.join(date_parts) if date_parts else pub_date
-                        except (IndexError, AttributeError):
-                            # Last resort: just use the raw date string
-                            date_str = pub_date
+
+            # feedparser already parsed the RSS/Atom date into a struct_time
+            published = entry.get('published_parsed')
+            date_str = time.strftime('%Y-%m-%d', published) if published else ''
 
             # Clean and parse title
             parsed = self.clean_title(title)
@@ -267,107 +605,71 @@ class AlbumFetcher:
 
             artist, album = parsed
             self.log(f"Processing: {artist} - {album}")
+            key = album_key(artist, album)
+            parsed_entries.append((artist, album, date_str, key))
 
-            # Search Apple Music first
-            apple_url = self.search_apple_music(artist, album)
-            album_link = None
+        # Deduplicate before any network I/O: claim each album not already
+        # being looked up (by this feed or another one)
+        pending = {}
+        for artist, album, _, key in parsed_entries:
+            if key not in self.lookups:
+                self.lookups[key] = asyncio.get_running_loop().create_future()
+                pending[key] = (artist, album)
 
-            if apple_url:
-                # Then get album.link URL
-                album_link = self.convert_url_to_album_link(apple_url)
+        try:
+            await self._resolve_lookups(pending)
+        finally:
+            for key in pending:
+                if not self.lookups[key].done():
+                    self.lookups[key].cancel()
+
+        results = []
+        for artist, album, date_str, key in parsed_entries:
+            apple_url, album_link = await self.lookups[key]
 
             # Add to results even if link not found (will show as placeholder)
-            results.append((artist, album, album_link or '', apple_url or '', date_str))
+            results.append(AlbumRow(artist, album, album_link or '', apple_url or '', date_str))
 
         return results
 
-
-class JazzProfilesFetcher(AlbumFetcher):
-    """Handles fetching and processing jazz albums from Jazz Profiles blog."""
-
-    RSS_URL = "https://jazzprofiles.blogspot.com/feeds/posts/default"
-
-    # Jazz Profiles specific patterns (album mentions, reviews, etc.)
-    REMOVE_PATTERNS = [
-        r'\s*album review\s*$',
-        r'\s*review\s*$',
-        r'\s*-\s*album\s*$',
-        r'\s*\[album\]\s*$',
-    ]
-
-    def clean_title(self, title: str) -> Optional[Tuple[str, str]]:
+    async def _resolve_lookups(self, pending: Dict[AlbumKey, Tuple[str, str]]):
         """
-        Clean title and extract artist and album from Jazz Profiles format.
-
-        Jazz Profiles may use different formats:
-        - "Artist - Album"
-        - "Artist: Album"
-        - "Album by Artist"
-        - Or just descriptive titles
+        Look up the claimed albums and publish (apple_url, album_link) to self.lookups.
 
         Args:
-            title: Raw title from RSS feed
-
-        Returns:
-            Tuple of (artist, album) or None if parsing fails
+            pending: Normalized album_key() -> (artist, album) to look up
         """
-        # Remove common suffixes
-        cleaned = title
-        for pattern in self.REMOVE_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-
-        cleaned = cleaned.strip()
-
-        # Try different separator patterns
-        # First try colon (like All About Jazz)
-        if ':' in cleaned:
-            parts = cleaned.split(':', 1)
-            if len(parts) == 2:
-                artist = parts[0].strip()
-                album = parts[1].strip()
-                if artist and album:
-                    return (artist, album)
-
-        # Try hyphen separator
-        if ' - ' in cleaned:
-            parts = cleaned.split(' - ', 1)
-            if len(parts) == 2:
-                artist = parts[0].strip()
-                album = parts[1].strip()
-                if artist and album:
-                    return (artist, album)
-
-        # Try "Album by Artist" format
-        if ' by ' in cleaned.lower():
-            match = re.search(r'^(.+?)\s+by\s+(.+?)$', cleaned, re.IGNORECASE)
-            if match:
-                album = match.group(1).strip()
-                artist = match.group(2).strip()
-                if artist and album:
-                    return (artist, album)
-
-        self.log(f"Skipping title - couldn't parse: {title}")
-        return None
-
-
-class JazzChillFetcher(AlbumFetcher):
-    """Handles fetching and processing jazz albums from JazzChill blog."""
-
-    RSS_URL = "https://jazzchill.blogspot.com/feeds/posts/default"
-
-    # JazzChill specific patterns (album mentions, reviews, etc.)
-    REMOVE_PATTERNS = [
-        r'\s*album review\s*$',
-        r'\s*review\s*$',
-        r'\s*-\s*album\s*$',
-        r'\s*\[album\]\s*$',
-    ]
+        # Prefetch Apple Music for all albums before any song.link call
+        # (at most ITUNES_CONCURRENCY requests in flight); the results land
+        # in the lookup cache that search_album_link reads
+        await self.search_apple_music_bulk(pending)
+
+        # Then resolve each album through the single search_album_link path
+        links = await asyncio.gather(*(
+            self.search_album_link(artist, album) for artist, album in pending.values()
+        ))
+
+        for key, link in zip(pending, links):
+            self.lookups[key].set_result(link)
+
+
+class BlogFetcher(AlbumFetcher):
+    """Base for blog feeds whose post titles don't follow a single format."""
+
+    # Blog specific suffixes (album mentions, reviews, etc.)
+    _SUFFIX_RE = re.compile(r'(?:\s*(?:album review|review|-\s*album|\[album\]))+\s*$', re.IGNORECASE)
+    _SPLIT_RE = re.compile(
+        r'^(?P<artist1>[^:]+):\s*(?P<album1>.+)$'
+        r'|^(?P<artist2>.+?) - (?P<album2>.+)$'
+        r'|^(?P<album3>[^\n]+?) by (?P<artist3>[^\n]+)$',
+        re.IGNORECASE | re.DOTALL,
+    )
 
     def clean_title(self, title: str) -> Optional[Tuple[str, str]]:
         """
-        Clean title and extract artist and album from JazzChill format.
+        Clean title and extract artist and album from a blog post title.
 
-        JazzChill may use different formats:
+        Blog posts may use different formats:
         - "Artist - Album"
         - "Artist: Album"
         - "Album by Artist"
@@ -380,117 +682,44 @@ class JazzChillFetcher(AlbumFetcher):
             Tuple of (artist, album) or None if parsing fails
         """
         # Remove common suffixes
-        cleaned = title
-        for pattern in self.REMOVE_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-
-        cleaned = cleaned.strip()
-
-        # Try different separator patterns
-        # First try colon (like All About Jazz)
-        if ':' in cleaned:
-            parts = cleaned.split(':', 1)
-            if len(parts) == 2:
-                artist = parts[0].strip()
-                album = parts[1].strip()
-                if artist and album:
-                    return (artist, album)
-
-        # Try hyphen separator
-        if ' - ' in cleaned:
-            parts = cleaned.split(' - ', 1)
-            if len(parts) == 2:
-                artist = parts[0].strip()
-                album = parts[1].strip()
-                if artist and album:
-                    return (artist, album)
-
-        # Try "Album by Artist" format
-        if ' by ' in cleaned.lower():
-            match = re.search(r'^(.+?)\s+by\s+(.+?)$', cleaned, re.IGNORECASE)
-            if match:
-                album = match.group(1).strip()
-                artist = match.group(2).strip()
-                if artist and album:
-                    return (artist, album)
+        cleaned = self._SUFFIX_RE.sub('', title).strip()
+
+        # Try separators in order: colon (like All About Jazz), hyphen,
+        # then "Album by Artist", in a single match
+        match = self._SPLIT_RE.match(cleaned)
+        if match:
+            artist = (match['artist1'] or match['artist2'] or match['artist3']).strip()
+            album = (match['album1'] or match['album2'] or match['album3']).strip()
+            if artist and album:
+                return (artist, album)
 
         self.log(f"Skipping title - couldn't parse: {title}")
         return None
 
 
-class JazzWaxFetcher(AlbumFetcher):
-    """Handles fetching and processing jazz albums from JazzWax blog."""
+class JazzProfilesFetcher(BlogFetcher):
+    """Handles fetching and processing jazz albums from Jazz Profiles blog."""
 
-    RSS_URL = "https://jazzwax.com/feed/"
+    RSS_URL = "https://jazzprofiles.blogspot.com/feeds/posts/default"
 
-    # JazzWax specific patterns (album mentions, reviews, etc.)
-    REMOVE_PATTERNS = [
-        r'\s*album review\s*$',
-        r'\s*review\s*$',
-        r'\s*-\s*album\s*$',
-        r'\s*\[album\]\s*$',
-    ]
 
-    def clean_title(self, title: str) -> Optional[Tuple[str, str]]:
-        """
-        Clean title and extract artist and album from JazzWax format.
+class JazzChillFetcher(BlogFetcher):
+    """Handles fetching and processing jazz albums from JazzChill blog."""
 
-        JazzWax may use different formats:
-        - "Artist - Album"
-        - "Artist: Album"
-        - "Album by Artist"
-        - Or just descriptive titles
+    RSS_URL = "https://jazzchill.blogspot.com/feeds/posts/default"
 
-        Args:
-            title: Raw title from RSS feed
 
-        Returns:
-            Tuple of (artist, album) or None if parsing fails
-        """
-        # Remove common suffixes
-        cleaned = title
-        for pattern in self.REMOVE_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-
-        cleaned = cleaned.strip()
-
-        # Try different separator patterns
-        # First try colon (like All About Jazz)
-        if ':' in cleaned:
-            parts = cleaned.split(':', 1)
-            if len(parts) == 2:
-                artist = parts[0].strip()
-                album = parts[1].strip()
-                if artist and album:
-                    return (artist, album)
-
-        # Try hyphen separator
-        if ' - ' in cleaned:
-            parts = cleaned.split(' - ', 1)
-            if len(parts) == 2:
-                artist = parts[0].strip()
-                album = parts[1].strip()
-                if artist and album:
-                    return (artist, album)
-
-        # Try "Album by Artist" format
-        if ' by ' in cleaned.lower():
-            match = re.search(r'^(.+?)\s+by\s+(.+?)$', cleaned, re.IGNORECASE)
-            if match:
-                album = match.group(1).strip()
-                artist = match.group(2).strip()
-                if artist and album:
-                    return (artist, album)
+class JazzWaxFetcher(BlogFetcher):
+    """Handles fetching and processing jazz albums from JazzWax blog."""
 
-        self.log(f"Skipping title - couldn't parse: {title}")
-        return None
+    RSS_URL = "https://jazzwax.com/feed/"
 
 
 class OutputGenerator:
     """Handles output generation in various formats."""
 
     @staticmethod
-    def generate_markdown(results: List[Tuple[str, str, str, str, str]], output_file: str):
+    def generate_markdown(results: List[AlbumRow], output_file: str):
         """Generate Markdown output."""
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write("## 🎶 New Jazz Albums\n\n")
@@ -498,35 +727,66 @@ class OutputGenerator:
             if not results:
                 f.write("No albums found.\n")
             else:
-                for artist, album, album_link, apple_link, date in results:
-                    f.write(f"- **{artist} — {album}** [[All]({album_link})] [[Apple]({apple_link})]")
-                    if date:
-                        f.write(f" _{date}_")
+                for row in results:
+                    f.write(f"- **{row.artist} — {row.album}** [[All]({row.album_link})] [[Apple]({row.apple_link})]")
+                    if row.date:
+                        f.write(f" _{row.date}_")
                     f.write("\n")
         print(f"Markdown output written to: {output_file}")
 
     @staticmethod
-    def generate_csv(results: List[Tuple[str, str, str, str, str]], output_file: str):
+    def generate_csv(results: List[AlbumRow], output_file: str):
         """Generate CSV output."""
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(['artist', 'album', 'album_link', 'apple_music_link', 'date'])
-            for row in results:
-                writer.writerow(row)
+            writer.writerows(
+                (row.artist, row.album, row.album_link, row.apple_link, row.date)
+                for row in results
+            )
         print(f"CSV output written to: {output_file}")
 
     @staticmethod
-    def generate_html(results: List[Tuple[str, str, str, str, str]], output_file: str,
-                     jazz_profiles_results: Optional[List[Tuple[str, str, str, str, str]]] = None,
-                     jazz_chill_results: Optional[List[Tuple[str, str, str, str, str]]] = None,
-                     jazz_wax_results: Optional[List[Tuple[str, str, str, str, str]]] = None):
+    def _album_cards(results: List[AlbumRow]) -> List[str]:
+        """Render an album.link embed for each album, or a placeholder if no link was found."""
+        cards = []
+        for row in results:
+            artist = html.escape(row.artist)
+            album = html.escape(row.album)
+            if row.album_link:
+                # Album found - show embed
+                cards.append(f'''        <div class="album-embed">
+            <iframe src="{row.embed_url}"
+                    frameborder="0"
+                    allowtransparency
+                    allowfullscreen
+                    title="{artist} - {album}">
+            </iframe>
+        </div>
+''')
+            else:
+                # Album not found - show placeholder with artist and album name
+                cards.append(f'''        <div class="album-embed placeholder">
+            <div class="placeholder-icon">🎵</div>
+            <div><strong>{artist}</strong></div>
+            <div style="font-size: 0.85em; margin-top: 5px;">{album}</div>
+            <div style="font-size: 0.75em; color: #555; margin-top: 10px;">Not available on streaming</div>
+        </div>
+''')
+        return cards
+
+    @staticmethod
+    def generate_html(results: List[AlbumRow], output_file: str,
+                     jazz_profiles_results: Optional[List[AlbumRow]] = None,
+                     jazz_chill_results: Optional[List[AlbumRow]] = None,
+                     jazz_wax_results: Optional[List[AlbumRow]] = None):
         """Generate HTML output with embedded album.link widgets from multiple sources."""
         total_albums = len(results) + \
                       (len(jazz_profiles_results) if jazz_profiles_results else 0) + \
                       (len(jazz_chill_results) if jazz_chill_results else 0) + \
                       (len(jazz_wax_results) if jazz_wax_results else 0)
 
-        html_content = '''<!DOCTYPE html>
+        parts = ['''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -796,172 +1056,87 @@ class OutputGenerator:
     <div class="section-container">
         <h2><a href="https://www.allaboutjazz.com/" target="_blank">🎺 All About Jazz</a></h2>
         <div class="grid-container">
-'''
+''']
 
         # Add All About Jazz album embeds or placeholders
-        for artist, album, album_link, apple_link, date in results:
-            if album_link:
-                # Album found - show embed
-                encoded_url = quote(album_link)
-                html_content += f'''        <div class="album-embed">
-            <iframe src="https://song.link/embed?url={encoded_url}"
-                    frameborder="0"
-                    allowtransparency
-                    allowfullscreen
-                    title="{artist} - {album}">
-            </iframe>
-        </div>
-'''
-            else:
-                # Album not found - show placeholder with artist and album name
-                html_content += f'''        <div class="album-embed placeholder">
-            <div class="placeholder-icon">🎵</div>
-            <div><strong>{artist}</strong></div>
-            <div style="font-size: 0.85em; margin-top: 5px;">{album}</div>
-            <div style="font-size: 0.75em; color: #555; margin-top: 10px;">Not available on streaming</div>
-        </div>
-'''
-
-        html_content += '''        </div>
-'''
+        parts.extend(OutputGenerator._album_cards(results))
+        parts.append('''        </div>
+''')
 
         # Add Jazz Profiles section if results provided
         if jazz_profiles_results:
-            html_content += '''
+            parts.append('''
         <h2><a href="https://jazzprofiles.blogspot.com/" target="_blank">🎹 Jazz Profiles</a></h2>
         <div class="grid-container">
-'''
-            for artist, album, album_link, apple_link, date in jazz_profiles_results:
-                if album_link:
-                    # Album found - show embed
-                    encoded_url = quote(album_link)
-                    html_content += f'''        <div class="album-embed">
-            <iframe src="https://song.link/embed?url={encoded_url}"
-                    frameborder="0"
-                    allowtransparency
-                    allowfullscreen
-                    title="{artist} - {album}">
-            </iframe>
-        </div>
-'''
-                else:
-                    # Album not found - show placeholder
-                    html_content += f'''        <div class="album-embed placeholder">
-            <div class="placeholder-icon">🎵</div>
-            <div><strong>{artist}</strong></div>
-            <div style="font-size: 0.85em; margin-top: 5px;">{album}</div>
-            <div style="font-size: 0.75em; color: #555; margin-top: 10px;">Not available on streaming</div>
-        </div>
-'''
-            html_content += '''        </div>
-'''
+''')
+            parts.extend(OutputGenerator._album_cards(jazz_profiles_results))
+            parts.append('''        </div>
+''')
 
         # Add JazzChill section if results provided
         if jazz_chill_results:
-            html_content += '''
+            parts.append('''
         <h2><a href="https://jazzchill.blogspot.com/" target="_blank">🎶 JazzChill</a></h2>
         <div class="grid-container">
-'''
-            for artist, album, album_link, apple_link, date in jazz_chill_results:
-                if album_link:
-                    # Album found - show embed
-                    encoded_url = quote(album_link)
-                    html_content += f'''        <div class="album-embed">
-            <iframe src="https://song.link/embed?url={encoded_url}"
-                    frameborder="0"
-                    allowtransparency
-                    allowfullscreen
-                    title="{artist} - {album}">
-            </iframe>
-        </div>
-'''
-                else:
-                    # Album not found - show placeholder
-                    html_content += f'''        <div class="album-embed placeholder">
-            <div class="placeholder-icon">🎵</div>
-            <div><strong>{artist}</strong></div>
-            <div style="font-size: 0.85em; margin-top: 5px;">{album}</div>
-            <div style="font-size: 0.75em; color: #555; margin-top: 10px;">Not available on streaming</div>
-        </div>
-'''
-            html_content += '''        </div>
-'''
+''')
+            parts.extend(OutputGenerator._album_cards(jazz_chill_results))
+            parts.append('''        </div>
+''')
 
         # Add JazzWax section if results provided
         if jazz_wax_results:
-            html_content += '''
+            parts.append('''
         <h2><a href="https://jazzwax.com/" target="_blank">🎺 JazzWax</a></h2>
         <div class="grid-container">
-'''
-            for artist, album, album_link, apple_link, date in jazz_wax_results:
-                if album_link:
-                    # Album found - show embed
-                    encoded_url = quote(album_link)
-                    html_content += f'''        <div class="album-embed">
-            <iframe src="https://song.link/embed?url={encoded_url}"
-                    frameborder="0"
-                    allowtransparency
-                    allowfullscreen
-                    title="{artist} - {album}">
-            </iframe>
-        </div>
-'''
-                else:
-                    # Album not found - show placeholder
-                    html_content += f'''        <div class="album-embed placeholder">
-            <div class="placeholder-icon">🎵</div>
-            <div><strong>{artist}</strong></div>
-            <div style="font-size: 0.85em; margin-top: 5px;">{album}</div>
-            <div style="font-size: 0.75em; color: #555; margin-top: 10px;">Not available on streaming</div>
-        </div>
-'''
-            html_content += '''        </div>
-'''
+''')
+            parts.extend(OutputGenerator._album_cards(jazz_wax_results))
+            parts.append('''        </div>
+''')
 
-        html_content += '''    </div>
+        parts.append('''    </div>
 
     <footer>
-        <p>Data from <a href="https://www.allaboutjazz.com/" target="_blank">All About Jazz</a>'''
+        <p>Data from <a href="https://www.allaboutjazz.com/" target="_blank">All About Jazz</a>''')
 
         if jazz_profiles_results:
-            html_content += ''', <a href="https://jazzprofiles.blogspot.com/" target="_blank">Jazz Profiles</a>'''
+            parts.append(''', <a href="https://jazzprofiles.blogspot.com/" target="_blank">Jazz Profiles</a>''')
 
         if jazz_chill_results:
-            html_content += ''', <a href="https://jazzchill.blogspot.com/" target="_blank">JazzChill</a>'''
+            parts.append(''', <a href="https://jazzchill.blogspot.com/" target="_blank">JazzChill</a>''')
 
         if jazz_wax_results:
-            html_content += ''', and <a href="https://jazzwax.com/" target="_blank">JazzWax</a>'''
+            parts.append(''', and <a href="https://jazzwax.com/" target="_blank">JazzWax</a>''')
 
-        html_content += ''' |
+        parts.append(''' |
            Links via <a href="https://album.link" target="_blank">Album.link</a></p>
         <p style="margin-top: 10px;">Generated by GetMusic</p>
     </footer>
 </body>
 </html>
-'''
+''')
 
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(''.join(parts))
 
         # Count how many have links vs placeholders
-        aaj_with_links = sum(1 for _, _, link, _, _ in results if link)
+        aaj_with_links = sum(1 for row in results if row.album_link)
         aaj_without_links = len(results) - aaj_with_links
 
         print(f"HTML output written to: {output_file}")
         print(f"All About Jazz: {aaj_with_links} album embeds and {aaj_without_links} placeholders from {len(results)} total albums")
 
         if jazz_profiles_results:
-            jp_with_links = sum(1 for _, _, link, _, _ in jazz_profiles_results if link)
+            jp_with_links = sum(1 for row in jazz_profiles_results if row.album_link)
             jp_without_links = len(jazz_profiles_results) - jp_with_links
             print(f"Jazz Profiles: {jp_with_links} album embeds and {jp_without_links} placeholders from {len(jazz_profiles_results)} total albums")
 
         if jazz_chill_results:
-            jc_with_links = sum(1 for _, _, link, _, _ in jazz_chill_results if link)
+            jc_with_links = sum(1 for row in jazz_chill_results if row.album_link)
             jc_without_links = len(jazz_chill_results) - jc_with_links
             print(f"JazzChill: {jc_with_links} album embeds and {jc_without_links} placeholders from {len(jazz_chill_results)} total albums")
 
         if jazz_wax_results:
-            jw_with_links = sum(1 for _, _, link, _, _ in jazz_wax_results if link)
+            jw_with_links = sum(1 for row in jazz_wax_results if row.album_link)
             jw_without_links = len(jazz_wax_results) - jw_with_links
             print(f"JazzWax: {jw_with_links} album embeds and {jw_without_links} placeholders from {len(jazz_wax_results)} total albums")
 
@@ -992,66 +1167,61 @@ def main():
         action='store_true',
         help='Skip fetching from Jazz Profiles (only fetch All About Jazz)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the persistent lookup cache'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=DEFAULT_CACHE_DIR,
+        help=f'Directory for the lookup cache (default: {DEFAULT_CACHE_DIR})'
+    )
 
     args = parser.parse_args()
-
-    # Fetch and process albums from All About Jazz
-    print("\n=== Fetching from All About Jazz ===")
-    aaj_fetcher = AlbumFetcher(verbose=args.verbose)
-    aaj_results = aaj_fetcher.process_feed()
-
-    # Count All About Jazz results
-    aaj_with_links = sum(1 for _, _, link, _, _ in aaj_results if link)
-    aaj_without_links = len(aaj_results) - aaj_with_links
-
-    print(f"\nAll About Jazz - Processed {len(aaj_results)} albums:")
-    print(f"  - {aaj_with_links} found on streaming services")
-    print(f"  - {aaj_without_links} not found (will show as placeholders)")
-
-    # Fetch and process albums from Jazz Profiles (unless skipped)
-    jp_results = None
-    if not args.skip_jazz_profiles:
-        print("\n=== Fetching from Jazz Profiles ===")
-        jp_fetcher = JazzProfilesFetcher(verbose=args.verbose)
-        jp_results = jp_fetcher.process_feed()
-
-        # Count Jazz Profiles results
-        jp_with_links = sum(1 for _, _, link, _, _ in jp_results if link)
-        jp_without_links = len(jp_results) - jp_with_links
-
-        print(f"\nJazz Profiles - Processed {len(jp_results)} albums:")
-        print(f"  - {jp_with_links} found on streaming services")
-        print(f"  - {jp_without_links} not found (will show as placeholders)")
-
-    # Fetch and process albums from JazzChill (unless skipped)
-    jc_results = None
-    if not args.skip_jazz_profiles:  # Use same flag for now
-        print("\n=== Fetching from JazzChill ===")
-        jc_fetcher = JazzChillFetcher(verbose=args.verbose)
-        jc_results = jc_fetcher.process_feed()
-
-        # Count JazzChill results
-        jc_with_links = sum(1 for _, _, link, _, _ in jc_results if link)
-        jc_without_links = len(jc_results) - jc_with_links
-
-        print(f"\nJazzChill - Processed {len(jc_results)} albums:")
-        print(f"  - {jc_with_links} found on streaming services")
-        print(f"  - {jc_without_links} not found (will show as placeholders)")
-
-    # Fetch and process albums from JazzWax (unless skipped)
-    jw_results = None
-    if not args.skip_jazz_profiles:  # Use same flag for now
-        print("\n=== Fetching from JazzWax ===")
-        jw_fetcher = JazzWaxFetcher(verbose=args.verbose)
-        jw_results = jw_fetcher.process_feed()
-
-        # Count JazzWax results
-        jw_with_links = sum(1 for _, _, link, _, _ in jw_results if link)
-        jw_without_links = len(jw_results) - jw_with_links
-
-        print(f"\nJazzWax - Processed {len(jw_results)} albums:")
-        print(f"  - {jw_with_links} found on streaming services")
-        print(f"  - {jw_without_links} not found (will show as placeholders)")
+    asyncio.run(main_async(args))
+
+
+async def main_async(args: argparse.Namespace):
+    """Fetch all feeds concurrently over a single shared HTTP client and write the output."""
+    # One song.link rate limiter and lookup cache for all feeds
+    rate_limiter = AsyncTokenBucket()
+    cache = negative_cache = None
+    if not args.no_cache:
+        cache = diskcache.Cache(args.cache_dir)
+        negative_cache = diskcache.Cache(os.path.join(args.cache_dir, NEGATIVE_CACHE_SUBDIR))
+
+    async with create_client() as client:
+        fetcher_options = {'verbose': args.verbose, 'rate_limiter': rate_limiter,
+                           'cache': cache, 'negative_cache': negative_cache, 'lookups': {},
+                           'itunes_limit': asyncio.Semaphore(AlbumFetcher.ITUNES_CONCURRENCY)}
+        fetchers = {'All About Jazz': AlbumFetcher(client, **fetcher_options)}
+
+        # Blog feeds (unless skipped)
+        if not args.skip_jazz_profiles:
+            fetchers['Jazz Profiles'] = JazzProfilesFetcher(client, **fetcher_options)
+            fetchers['JazzChill'] = JazzChillFetcher(client, **fetcher_options)
+            fetchers['JazzWax'] = JazzWaxFetcher(client, **fetcher_options)
+
+        print(f"\n=== Fetching from {', '.join(fetchers)} ===")
+        feed_results = dict(zip(fetchers, await asyncio.gather(*(
+            fetcher.process_feed() for fetcher in fetchers.values()
+        ))))
+
+    if cache is not None:
+        cache.close()
+        negative_cache.close()
+
+    # Count results per feed
+    for name, results in feed_results.items():
+        with_links = sum(1 for row in results if row.album_link)
+        without_links = len(results) - with_links
+
+        print(f"\n{name} - Processed {len(results)} albums:")
+        print(f"  - {with_links} found on streaming services")
+        print(f"  - {without_links} not found (will show as placeholders)")
+
+    aaj_results = feed_results['All About Jazz']
 
     # Generate output
     if args.format == 'markdown':
@@ -1062,9 +1232,9 @@ def main():
         print("\nNote: CSV format only includes All About Jazz results")
     elif args.format == 'html':
         OutputGenerator.generate_html(aaj_results, args.output,
-                                      jazz_profiles_results=jp_results,
-                                      jazz_chill_results=jc_results,
-                                      jazz_wax_results=jw_results)
+                                      jazz_profiles_results=feed_results.get('Jazz Profiles'),
+                                      jazz_chill_results=feed_results.get('JazzChill'),
+                                      jazz_wax_results=feed_results.get('JazzWax'))
         print()
 
     print(f"✓ Successfully completed - output written to {args.output}")